@@ -1,17 +1,32 @@
+import time
+_SETUP_START = time.perf_counter()
+
 import streamlit as st
 import pandas as pd
 import numpy as np
-import google.generativeai as genai
-import requests
-from bs4 import BeautifulSoup
-import plotly.express as px
-import plotly.graph_objects as go
-from docx import Document
+import importlib
+import logging
+import sys
 import io
 import math
 import json
 import re
-import time
+
+logger = logging.getLogger("communicationscorer")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s: %(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+# google.generativeai / requests / bs4 / plotly / docx 较重，统一通过 timed_import 在使用处导入
+def timed_import(name):
+    if name in sys.modules:
+        return sys.modules[name]
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    logger.info("lazy import %s: %.3fs", name, time.perf_counter() - start)
+    return module
 
 st.set_page_config(
     page_title="肿瘤业务-传播价值 AI 评分系统",
@@ -95,13 +110,21 @@ st.markdown("""
 class ScorerEngine:
     def __init__(self, key):
         self.api_key = key
-        if self.api_key and str(self.api_key).strip():
-            genai.configure(api_key=self.api_key)
+        self._genai = None
+
+    def get_genai(self):
+        if self._genai is None:
+            genai = timed_import("google.generativeai")
+            if self.api_key and str(self.api_key).strip():
+                genai.configure(api_key=self.api_key)
+            self._genai = genai
+        return self._genai
 
     def read_docx_content(self, file_obj):
         try:
+            docx = timed_import("docx")
             file_obj.seek(0)
-            doc = Document(file_obj)
+            doc = docx.Document(file_obj)
             full_text = []
             for para in doc.paragraphs:
                 if para.text.strip(): full_text.append(para.text.strip())
@@ -117,6 +140,8 @@ class ScorerEngine:
     def fetch_url_content(self, url):
         if not url or pd.isna(url): return ""
         if not str(url).startswith('http'): return ""
+        requests = timed_import("requests")
+        bs4 = timed_import("bs4")
         try:
             jina_url = f"https://r.jina.ai/{url}"
             response = requests.get(jina_url, timeout=5)
@@ -126,7 +151,7 @@ class ScorerEngine:
             headers = {'User-Agent': 'Mozilla/5.0'}
             response = requests.get(url, headers=headers, timeout=5)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = bs4.BeautifulSoup(response.content, 'html.parser')
                 text = " ".join([p.get_text() for p in soup.find_all('p')])
                 if len(text) > 50: return text[:10000]
         except: pass
@@ -157,7 +182,7 @@ class ScorerEngine:
         return 3
 
     def analyze_content_with_ai(self, content, key_message, project_desc, audience_mode, media_name):
-        if not self.api_key: return 0, 0, 0, "API Key Missing", "无评价"
+        if not self.api_key or not str(self.api_key).strip(): return 0, 0, 0, "API Key Missing", "无评价"
         
         if not content or len(str(content).strip()) < 10:
              return 0, 0, 0, "内容过短/无效", "内容过短，无法生成评价"
@@ -211,6 +236,7 @@ class ScorerEngine:
             except: pass
             return None
 
+        genai = self.get_genai()
         last_error = None
         for model_name in candidate_models:
             try:
@@ -331,6 +357,9 @@ with st.sidebar:
 
 engine = ScorerEngine(api_key)
 
+# 进程内首次运行为冷启动耗时，之后的 rerun 模块均已缓存；冷启动回归用 scripts/check_cold_start.py 检查
+logger.info("module setup: %.3fs", time.perf_counter() - _SETUP_START)
+
 st.title("📡 肿瘤业务-传播价值 AI 评分系统")
 
 with st.expander("查看核心算法公式", expanded=False):
@@ -548,6 +577,9 @@ with tab3:
     if st.session_state.batch_results_df is None:
         st.info("👋 请先完成“新闻稿评分”和“媒体报道评分”。")
     else:
+        px = timed_import("plotly.express")
+        go = timed_import("plotly.graph_objects")
+
         res_df = st.session_state.batch_results_df
         
         st.subheader(f"📈 项目评分: {project_name if project_name else '未命名项目'}")
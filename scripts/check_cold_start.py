@@ -0,0 +1,64 @@
+"""冷启动导入检查: 在全新解释器中以 bare 模式执行 app.py，确认重依赖没有在模块级被导入。
+
+用法: python scripts/check_cold_start.py
+"""
+import json
+import os
+import subprocess
+import sys
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app.py")
+
+# 这些依赖只应在对应功能首次使用时导入
+LAZY_MODULES = ["google.generativeai", "plotly", "docx", "bs4", "requests"]
+
+CHILD_CODE = """
+import json, runpy, sys
+runpy.run_path(sys.argv[1], run_name="__main__")
+print("@@LOADED@@" + json.dumps([m for m in sys.argv[2:] if m in sys.modules]))
+"""
+
+
+def parse_importtime(stderr, top=10):
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            _, cumulative_us, name = line[len("import time:"):].split("|")
+            rows.append((int(cumulative_us), name[1:].rstrip()))
+        except ValueError:
+            continue
+    # 嵌套导入的名称带缩进，只累加顶层导入以免重复计算
+    total_us = sum(c for c, name in rows if not name.startswith(" "))
+    return total_us, sorted(rows, reverse=True)[:top]
+
+
+def main():
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_CODE, APP_PATH, *LAZY_MODULES],
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+    )
+    marker = [l for l in proc.stdout.splitlines() if l.startswith("@@LOADED@@")]
+    if proc.returncode != 0 or not marker:
+        print(proc.stderr[-2000:], file=sys.stderr)
+        print("❌ app.py 执行失败", file=sys.stderr)
+        return 1
+
+    total_us, slowest = parse_importtime(proc.stderr)
+    print(f"模块级导入总耗时: {total_us / 1e6:.2f}s")
+    for cumulative_us, name in slowest:
+        print(f"  {cumulative_us / 1e6:8.3f}s  {name.strip()}")
+
+    loaded = json.loads(marker[-1][len("@@LOADED@@"):])
+    if loaded:
+        print(f"❌ 以下依赖在模块级被导入，应改为按需导入: {loaded}", file=sys.stderr)
+        return 1
+    print("✅ 重依赖均为按需导入")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())